@@ -120,6 +120,10 @@ fi
 if [ -f $FUNC_TEST_SCRIPT ]; then
     $FUNC_TEST_SCRIPT
 else
+    # The functional suite has to run sequentially: delete_orphans is
+    # server-global and several modules (test_orphans, test_crd_artifacts,
+    # test_repo_versions, ...) depend on orphaned content surviving until
+    # their own cleanup, so a concurrent worker's cleanup would race them.
     pytest -v -r sx --color=yes --pyargs pulpcore.tests.functional || show_logs_and_return_non_zero
 fi
 
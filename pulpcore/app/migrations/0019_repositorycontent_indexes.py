@@ -0,0 +1,25 @@
+# Generated by Django 2.2.28 on 2026-09-01 16:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_auto_20191127_2350'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='repositorycontent',
+            index=models.Index(fields=['repository', 'version_added'], name='core_reposi_reposit_e2798b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='repositorycontent',
+            index=models.Index(fields=['repository', 'version_removed'], name='core_reposi_reposit_3b33a3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='repositorycontent',
+            index=models.Index(fields=['version_added', 'version_removed'], name='core_reposi_version_6a40d8_idx'),
+        ),
+    ]
@@ -107,6 +107,35 @@ class MasterModel(Model, metaclass=MasterModelMeta):
                                                          type=self.TYPE)
         return super().save(*args, **kwargs)
 
+    @classmethod
+    def get_model_for_pulp_type(cls, pulp_type):
+        """Return the detail model class whose instances carry the given pulp_type.
+
+        The master/detail class hierarchy is walked once and memoized per master model,
+        so resolving a pulp_type string to its model class costs no database queries.
+
+        Args:
+            pulp_type (str): The pulp_type to look up, e.g. "file.file".
+
+        Returns:
+            type: The model class registered for ``pulp_type``.
+
+        Raises:
+            KeyError: If no model in this master model's hierarchy declares ``pulp_type``.
+        """
+        registry = cls.__dict__.get('_pulp_type_registry')
+        if registry is None:
+            registry = {}
+            models_to_walk = [cls]
+            while models_to_walk:
+                model = models_to_walk.pop()
+                if model.TYPE is not None:
+                    registry['{app_label}.{type}'.format(app_label=model._meta.app_label,
+                                                         type=model.TYPE)] = model
+                models_to_walk.extend(model.__subclasses__())
+            cls._pulp_type_registry = registry
+        return registry[pulp_type]
+
     def cast(self):
         """Return a "Detail" model instance of this master-detail pair.
 
@@ -2,13 +2,14 @@
 Repository related Django models.
 """
 from contextlib import suppress
+from functools import lru_cache
 from gettext import gettext as _
-from os import path
 import logging
 
 import django
-from django.db import models, transaction
+from django.db import connection, models, transaction
 from django.urls import reverse
+from django.utils.functional import cached_property
 
 from pulpcore.app.util import get_view_name_for_model
 from pulpcore.download.factory import DownloaderFactory
@@ -22,6 +23,20 @@ from .task import CreatedResource, Task
 _logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _list_url_for_model(model_cls):
+    """
+    Reverse the 'list' view url for a model class, or None if it has no viewset.
+
+    The result only depends on the model class and the URL conf, so it is memoized to
+    spare repeated URL-pattern walks when serializing many count rows.
+    """
+    try:
+        return reverse(get_view_name_for_model(model_cls, 'list'))
+    except django.urls.exceptions.NoReverseMatch:
+        return None
+
+
 class Repository(MasterModel):
     """
     Collection of content.
@@ -69,11 +84,14 @@ class Repository(MasterModel):
 
         This method can be overriden by plugins if they require custom logic.
         """
-        version = RepositoryVersion(
-            repository=self,
-            number=self.last_version,
-            complete=True)
-        version.save()
+        # bulk_create issues the INSERT without per-instance save() and signal
+        # overhead, which the initial version does not need.
+        RepositoryVersion.objects.bulk_create([
+            RepositoryVersion(
+                repository=self,
+                number=self.last_version,
+                complete=True)
+        ])
 
     def new_version(self, base_version=None):
         """
@@ -94,15 +112,19 @@ class Repository(MasterModel):
                 repository=self,
                 number=int(self.last_version) + 1,
                 base_version=base_version)
+            # A targeted update() persists just the changed column and skips the
+            # full-row UPDATE plus nested atomic block that save() would issue.
             self.last_version = version.number
-            self.save()
+            Repository.objects.filter(pk=self.pk).update(last_version=version.number)
             version.save()
 
             if base_version:
                 # first remove the content that isn't in the base version
                 version.remove_content(version.content.exclude(pk__in=base_version.content))
-                # now add any content that's in the base_version but not in version
-                version.add_content(base_version.content.exclude(pk__in=version.content))
+                # now add any content that's in the base_version but not in version;
+                # add_content already diffs against the version's content server-side,
+                # so the base version's content set can be passed through unfiltered
+                version.add_content(base_version.content)
 
             if Task.current:
                 resource = CreatedResource(content_object=version)
@@ -225,7 +247,7 @@ class Remote(MasterModel):
     download_concurrency = models.PositiveIntegerField(default=20)
     policy = models.TextField(choices=POLICY_CHOICES, default=IMMEDIATE)
 
-    @property
+    @cached_property
     def download_factory(self):
         """
         Return the DownloaderFactory which can be used to generate asyncio capable downloaders.
@@ -239,11 +261,7 @@ class Remote(MasterModel):
             DownloadFactory: The instantiated DownloaderFactory to be used by
                 get_downloader().
         """
-        try:
-            return self._download_factory
-        except AttributeError:
-            self._download_factory = DownloaderFactory(self)
-            return self._download_factory
+        return DownloaderFactory(self)
 
     def get_downloader(self, remote_artifact=None, url=None, **kwargs):
         """
@@ -275,17 +293,27 @@ class Remote(MasterModel):
             raise ValueError(_("get_downloader() requires either 'remote_artifact' and 'url'."))
         if remote_artifact:
             url = remote_artifact.url
-            expected_digests = {}
-            for digest_name in Artifact.DIGEST_FIELDS:
-                digest_value = getattr(remote_artifact, digest_name)
-                if digest_value:
-                    expected_digests[digest_name] = digest_value
+            # Loaded field values live in __dict__; reading them there skips the field
+            # descriptor protocol, which matters in the per-RemoteArtifact sync loop.
+            loaded_fields = remote_artifact.__dict__
+            expected_digests = {
+                digest_name: loaded_fields[digest_name]
+                for digest_name in Artifact.DIGEST_FIELDS
+                if loaded_fields.get(digest_name)
+            }
             if expected_digests:
                 kwargs['expected_digests'] = expected_digests
             if remote_artifact.size:
                 kwargs['expected_size'] = remote_artifact.size
         return self.download_factory.build(url, **kwargs)
 
+    @cached_property
+    def _url_base(self):
+        """
+        The Remote's url normalized to end with a single '/', for joining relative paths.
+        """
+        return self.url if self.url.endswith('/') else self.url + '/'
+
     def get_remote_artifact_url(self, relative_path=None):
         """
         Get the full URL for a RemoteArtifact from a relative path.
@@ -303,9 +331,9 @@ class Remote(MasterModel):
         Returns:
             str: A URL for a RemoteArtifact available at the Remote.
         """
-        if path.isabs(relative_path):
+        if relative_path.startswith('/'):
             raise ValueError(_("Relative path can't start with '/'. {0}").format(relative_path))
-        return path.join(self.url, relative_path)
+        return self._url_base + relative_path
 
     def get_remote_artifact_content_type(self, relative_path=None):
         """
@@ -354,6 +382,26 @@ class RepositoryContent(Model):
     class Meta:
         unique_together = (('repository', 'content', 'version_added'),
                            ('repository', 'content', 'version_removed'))
+        # The hot queries (content property, _squash, _compute_counts, remove_content)
+        # filter by repository and version columns without a content pk, which the
+        # unique_together indexes cannot serve with their leading columns.
+        indexes = [
+            models.Index(fields=['repository', 'version_added']),
+            models.Index(fields=['repository', 'version_removed']),
+            models.Index(fields=['version_added', 'version_removed']),
+        ]
+
+
+class RepositoryVersionManager(models.Manager):
+
+    def get_queryset(self):
+        """
+        Returns a queryset with the version's repository and base_version joined in.
+
+        Nearly every consumer of a RepositoryVersion dereferences its repository, so the
+        related rows are fetched with the version itself instead of via follow-up queries.
+        """
+        return super().get_queryset().select_related('repository', 'base_version')
 
 
 class RepositoryVersion(Model):
@@ -389,6 +437,8 @@ class RepositoryVersion(Model):
     base_version = models.ForeignKey('RepositoryVersion', null=True,
                                      on_delete=models.SET_NULL)
 
+    objects = RepositoryVersionManager()
+
     class Meta:
         default_related_name = 'versions'
         unique_together = ('repository', 'number')
@@ -414,12 +464,17 @@ class RepositoryVersion(Model):
             >>>     ...
             >>>
         """
-        relationships = RepositoryContent.objects.filter(
-            repository=self.repository, version_added__number__lte=self.number
-        ).exclude(
-            version_removed__number__lte=self.number
+        # All conditions live in a single filter() call so they constrain the same
+        # membership row; this joins the membership table once instead of passing a
+        # subquery of a subquery to the database. No DISTINCT is needed: a content
+        # unit can only be re-added after it was removed, so at most one membership
+        # row per content can satisfy added <= number < removed for any number.
+        return Content.objects.filter(
+            models.Q(version_memberships__version_removed__isnull=True)
+            | models.Q(version_memberships__version_removed__number__gt=self.number),
+            version_memberships__repository=self.repository,
+            version_memberships__version_added__number__lte=self.number,
         )
-        return Content.objects.filter(version_memberships__in=relationships)
 
     @property
     def artifacts(self):
@@ -429,7 +484,12 @@ class RepositoryVersion(Model):
         Returns:
             django.db.models.QuerySet: The artifacts that are contained within this version.
         """
-        Artifact.objects.filter(content__pk__in=self.content)
+        return Artifact.objects.filter(
+            models.Q(content__version_memberships__version_removed__isnull=True)
+            | models.Q(content__version_memberships__version_removed__number__gt=self.number),
+            content__version_memberships__repository=self.repository,
+            content__version_memberships__version_added__number__lte=self.number,
+        ).distinct()
 
     def added(self):
         """
@@ -452,7 +512,13 @@ class RepositoryVersion(Model):
         Returns:
             bool: True if the repository version contains the content, False otherwise
         """
-        return self.content.filter(pk=content.pk).exists()
+        return RepositoryContent.objects.filter(
+            repository=self.repository,
+            content_id=content.pk,
+            version_added__number__lte=self.number,
+        ).exclude(
+            version_removed__number__lte=self.number
+        ).exists()
 
     def add_content(self, content):
         """
@@ -469,17 +535,27 @@ class RepositoryVersion(Model):
         if self.complete:
             raise ResourceImmutableError(self)
 
-        repo_content = []
-        for content_pk in content.exclude(pk__in=self.content).values_list('pk', flat=True):
-            repo_content.append(
+        # Let the database compute the set of new content; only the missing pks cross the
+        # wire. They are streamed in server-side chunks and flushed in bounded batches so
+        # memory stays flat no matter how much content is being added.
+        batch_size = 2000
+        missing_content_pks = content.exclude(pk__in=self.content).values_list(
+            'pk', flat=True).iterator(chunk_size=batch_size)
+
+        batch = []
+        for content_pk in missing_content_pks:
+            batch.append(
                 RepositoryContent(
                     repository=self.repository,
                     content_id=content_pk,
                     version_added=self
                 )
             )
-
-        RepositoryContent.objects.bulk_create(repo_content)
+            if len(batch) == batch_size:
+                RepositoryContent.objects.bulk_create(batch, batch_size=batch_size)
+                batch = []
+        if batch:
+            RepositoryContent.objects.bulk_create(batch, batch_size=batch_size)
 
     def remove_content(self, content):
         """
@@ -511,11 +587,11 @@ class RepositoryVersion(Model):
             RepositoryVersion.DoesNotExist: if there is not a RepositoryVersion for the same
                 repository and with a higher "number".
         """
-        try:
-            return self.repository.versions.exclude(complete=False).filter(
-                number__gt=self.number).order_by('number')[0]
-        except IndexError:
+        version = self.repository.versions.filter(
+            complete=True, number__gt=self.number).order_by('number').first()
+        if version is None:
             raise self.DoesNotExist
+        return version
 
     def previous(self):
         """
@@ -527,40 +603,86 @@ class RepositoryVersion(Model):
             RepositoryVersion.DoesNotExist: if there is not a RepositoryVersion for the same
                 repository and with a lower "number".
         """
-        try:
-            return self.repository.versions.exclude(complete=False).filter(
-                number__lt=self.number).order_by('-number')[0]
-        except IndexError:
+        version = self.repository.versions.filter(
+            complete=True, number__lt=self.number).order_by('-number').first()
+        if version is None:
             raise self.DoesNotExist
+        return version
 
-    def _squash(self, repo_relations, next_version):
+    def _squash(self, next_version):
         """
         Squash a complete repo version into the next version
-        """
-        # delete any relationships added in the version being deleted and removed in the next one.
-        repo_relations.filter(version_added=self, version_removed=next_version).delete()
 
-        # If the same content is deleted in version, but added back in next_version
-        # set version_removed field in relation to None, and remove relation adding the content
-        # in next_version
-        content_added = repo_relations.filter(version_added=next_version).values_list('content_id')
-
-        # use list() to force the evaluation of the queryset, otherwise queryset is affected
-        # by the update() operation before delete() is ran
-        content_removed_and_readded = list(repo_relations.filter(version_removed=self,
-                                                                 content_id__in=content_added)
-                                           .values_list('content_id'))
-
-        repo_relations.filter(version_removed=self,
-                              content_id__in=content_removed_and_readded)\
-            .update(version_removed=None)
-
-        repo_relations.filter(version_added=next_version,
-                              content_id__in=content_removed_and_readded).delete()
-
-        # "squash" by moving other additions and removals forward to the next version
-        repo_relations.filter(version_added=self).update(version_added=next_version)
-        repo_relations.filter(version_removed=self).update(version_removed=next_version)
+        The mutations run as a single data-modifying CTE so the squash costs one
+        round-trip instead of six. The sub-statements of a WITH share one snapshot and
+        Postgres forbids modifying the same row from two of them, so every branch
+        carries explicit exclusions ensuring each row is touched exactly once; rows
+        are identified by their version foreign keys alone since a version belongs to
+        exactly one repository. Rows both added and removed in this version (a
+        plugin's finalize_new_version can remove content added in the same version)
+        get their own branches that handle both columns together.
+        """
+        table = RepositoryContent._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                WITH del_squashed AS (
+                    -- relationships added in this version and removed in the next one
+                    DELETE FROM {table}
+                    WHERE version_added_id = %(version)s
+                      AND version_removed_id = %(next_version)s
+                ), del_ephemeral_readded AS (
+                    -- rows added and removed within this same version whose content
+                    -- comes back in the next version: the next version's own row
+                    -- carries the membership, so these rows simply go away
+                    DELETE FROM {table}
+                    WHERE version_added_id = %(version)s
+                      AND version_removed_id = %(version)s
+                      AND content_id IN (
+                          SELECT content_id FROM {table}
+                          WHERE version_added_id = %(next_version)s
+                      )
+                ), shift_ephemeral AS (
+                    -- other rows added and removed within this version move both
+                    -- columns forward in one sub-statement
+                    UPDATE {table} SET version_added_id = %(next_version)s,
+                                       version_removed_id = %(next_version)s
+                    WHERE version_added_id = %(version)s
+                      AND version_removed_id = %(version)s
+                      AND content_id NOT IN (
+                          SELECT content_id FROM {table}
+                          WHERE version_added_id = %(next_version)s
+                      )
+                ), readded AS (
+                    -- content removed in this version but added back in the next one
+                    -- becomes a single continuous membership
+                    UPDATE {table} SET version_removed_id = NULL
+                    WHERE version_removed_id = %(version)s
+                      AND version_added_id IS DISTINCT FROM %(version)s
+                      AND content_id IN (
+                          SELECT content_id FROM {table}
+                          WHERE version_added_id = %(next_version)s
+                      )
+                    RETURNING content_id
+                ), del_readded AS (
+                    DELETE FROM {table}
+                    WHERE version_added_id = %(next_version)s
+                      AND content_id IN (SELECT content_id FROM readded)
+                ), shift_added AS (
+                    -- move the remaining additions forward to the next version
+                    UPDATE {table} SET version_added_id = %(next_version)s
+                    WHERE version_added_id = %(version)s
+                      AND version_removed_id IS DISTINCT FROM %(next_version)s
+                      AND version_removed_id IS DISTINCT FROM %(version)s
+                )
+                -- and the remaining removals as well
+                UPDATE {table} SET version_removed_id = %(next_version)s
+                WHERE version_removed_id = %(version)s
+                  AND version_added_id IS DISTINCT FROM %(version)s
+                  AND content_id NOT IN (SELECT content_id FROM readded)
+                """.format(table=table),
+                {'version': self.pk, 'next_version': next_version.pk},
+            )
 
     def delete(self, **kwargs):
         """
@@ -576,7 +698,7 @@ class RepositoryVersion(Model):
             repo_relations = RepositoryContent.objects.filter(repository=self.repository)
             try:
                 next_version = self.next()
-                self._squash(repo_relations, next_version)
+                self._squash(next_version)
 
             except RepositoryVersion.DoesNotExist:
                 # version is the latest version so simply update repo contents
@@ -592,7 +714,8 @@ class RepositoryVersion(Model):
                     .update(version_removed=None)
                 CreatedResource.objects.filter(object_id=self.pk).delete()
                 self.repository.last_version = self.number - 1
-                self.repository.save()
+                Repository.objects.filter(pk=self.repository_id).update(
+                    last_version=self.repository.last_version)
                 super().delete(**kwargs)
 
     def _compute_counts(self):
@@ -604,24 +727,36 @@ class RepositoryVersion(Model):
         objects and makes new ones with each call.
         """
         with transaction.atomic():
+            RepositoryVersionContentDetails.objects.filter(repository_version=self).delete()
+            # One GROUP BY over the membership table computes all three count types at
+            # once instead of running a separate annotated query per count type.
+            present = (
+                models.Q(version_added__number__lte=self.number)
+                & (models.Q(version_removed__isnull=True)
+                   | models.Q(version_removed__number__gt=self.number))
+            )
+            annotated = RepositoryContent.objects.filter(
+                models.Q(version_added=self) | models.Q(version_removed=self) | present,
+                repository=self.repository,
+            ).values('content__pulp_type').annotate(
+                added=models.Count('pk', filter=models.Q(version_added=self)),
+                present=models.Count('pk', filter=present),
+                removed=models.Count('pk', filter=models.Q(version_removed=self)),
+            )
             counts_list = []
-            for value, name in RepositoryVersionContentDetails.COUNT_TYPE_CHOICES:
-                RepositoryVersionContentDetails.objects.filter(repository_version=self).delete()
-                if value == RepositoryVersionContentDetails.ADDED:
-                    qs = self.added()
-                elif value == RepositoryVersionContentDetails.PRESENT:
-                    qs = self.content
-                elif value == RepositoryVersionContentDetails.REMOVED:
-                    qs = self.removed()
-                annotated = qs.values('pulp_type').annotate(count=models.Count('pulp_type'))
-                for item in annotated:
-                    count_obj = RepositoryVersionContentDetails(
-                        content_type=item['pulp_type'],
-                        repository_version=self,
-                        count=item['count'],
-                        count_type=value,
-                    )
-                    counts_list.append(count_obj)
+            for item in annotated:
+                for value, count in ((RepositoryVersionContentDetails.ADDED, item['added']),
+                                     (RepositoryVersionContentDetails.PRESENT, item['present']),
+                                     (RepositoryVersionContentDetails.REMOVED, item['removed'])):
+                    if count:
+                        counts_list.append(
+                            RepositoryVersionContentDetails(
+                                content_type=item['content__pulp_type'],
+                                repository_version=self,
+                                count=count,
+                                count_type=value,
+                            )
+                        )
             RepositoryVersionContentDetails.objects.bulk_create(counts_list)
 
     def __enter__(self):
@@ -642,7 +777,7 @@ class RepositoryVersion(Model):
         else:
             try:
                 self.repository.finalize_new_version(self)
-                no_change = not self.added() and not self.removed()
+                no_change = not self.added().exists() and not self.removed().exists()
                 if no_change:
                     self.delete()
                 else:
@@ -657,6 +792,15 @@ class RepositoryVersion(Model):
         return "<Repository: {}; Version: {}>".format(self.repository.name, self.number)
 
 
+class RepositoryVersionContentDetailsManager(models.Manager):
+
+    def get_queryset(self):
+        """
+        Returns a queryset with the count's repository version and repository joined in.
+        """
+        return super().get_queryset().select_related('repository_version__repository')
+
+
 class RepositoryVersionContentDetails(models.Model):
     ADDED = 'A'
     PRESENT = 'P'
@@ -676,6 +820,8 @@ class RepositoryVersionContentDetails(models.Model):
                                            on_delete=models.CASCADE)
     count = models.IntegerField()
 
+    objects = RepositoryVersionContentDetailsManager()
+
     @property
     def content_href(self):
         """
@@ -690,18 +836,14 @@ class RepositoryVersionContentDetails(models.Model):
         Returns:
             dict: {<pulp_type>: <url>}
         """
-        ctype_model = Content.objects.filter(pulp_type=self.content_type).first().cast().__class__
-        ctype_view = get_view_name_for_model(ctype_model, 'list')
-        try:
-            ctype_url = reverse(ctype_view)
-        except django.urls.exceptions.NoReverseMatch:
+        ctype_model = Content.get_model_for_pulp_type(self.content_type)
+        ctype_url = _list_url_for_model(ctype_model)
+        if ctype_url is None:
             # We've hit a content type for which there is no viewset.
             # There's nothing we can do here, except to skip it.
             return
         repository = self.repository_version.repository.cast()
-        repository_view = get_view_name_for_model(repository.__class__, 'list')
-
-        repository_url = reverse(repository_view)
+        repository_url = _list_url_for_model(repository.__class__)
         rv_href = repository_url + str(repository.pk) + "/versions/{version}/".format(
             version=self.repository_version.number)
         if self.count_type == self.ADDED:
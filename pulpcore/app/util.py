@@ -4,6 +4,10 @@ from pulpcore.app import models
 # a little cache so viewset_for_model doesn't have iterate over every app every time
 _model_viewset_cache = {}
 
+# same idea for view names, so view_name_for_model doesn't walk every router registry
+# every time an href is generated for a task resource or serializer field
+_viewset_view_name_cache = {}
+
 
 # based on their name, viewset_for_model and view_name_for_model look like they should
 # live over in the viewsets namespace, but these tools exist for serializers, which are
@@ -64,10 +68,15 @@ def get_view_name_for_model(model_obj, view_action):
         model_obj = model_obj.cast()
     viewset = get_viewset_for_model(model_obj)
 
+    if (viewset, view_action) in _viewset_view_name_cache:
+        return _viewset_view_name_cache[(viewset, view_action)]
+
     # return the complete view name, joining the registered viewset base name with
     # the requested view method.
     for router in all_routers:
         for pattern, registered_viewset, base_name in router.registry:
             if registered_viewset is viewset:
-                return '-'.join((base_name, view_action))
+                view_name = '-'.join((base_name, view_action))
+                _viewset_view_name_cache[(viewset, view_action)] = view_name
+                return view_name
     raise LookupError('view not found')
@@ -189,7 +189,7 @@ class RepositoryVersionViewSet(NamedModelViewSet,
     parent_viewset = RepositoryViewSet
     parent_lookup_kwargs = {'repository_pk': 'repository__pk'}
     serializer_class = RepositoryVersionSerializer
-    queryset = RepositoryVersion.objects.exclude(complete=False)
+    queryset = RepositoryVersion.objects.exclude(complete=False).prefetch_related('counts')
     filterset_class = RepositoryVersionFilter
     filter_backends = (OrderingFilter, DjangoFilterBackend)
     ordering = ('-number',)
@@ -2,7 +2,9 @@ import logging
 import mimetypes
 import os
 import re
+from functools import lru_cache
 from gettext import gettext as _
+from pathlib import PurePosixPath
 
 import django  # noqa otherwise E402: module level not at top of file
 django.setup()  # noqa otherwise E402: module level not at top of file
@@ -25,6 +27,25 @@ from jinja2 import Template
 
 log = logging.getLogger(__name__)
 
+# Resolved once at import: every served file consults these, and each dynaconf
+# attribute access costs a dictionary walk that adds up on the streaming path.
+DEFAULT_FILE_STORAGE = settings.DEFAULT_FILE_STORAGE
+MEDIA_ROOT = settings.MEDIA_ROOT
+
+# Compiled once instead of per directory listing.
+_DIRECTORY_LISTING_TEMPLATE = Template("""
+<!DOCTYPE html>
+<html>
+    <body>
+        <ul>
+        {% for name in dir_list %}
+            <li><a href="{{ name|e }}">{{ name|e }}</a></li>
+        {% endfor %}
+        </ul>
+    </body>
+</html>
+""")
+
 
 class PathNotResolved(HTTPNotFound):
     """
@@ -84,6 +105,20 @@ class Handler:
 
     distribution_model = None
 
+    # Cast Remote instances by pk, shared by all handlers in the process. Each
+    # fresh instance would build its own DownloaderFactory (SSL context, client
+    # session, concurrency semaphore) per streamed file; reusing the instance
+    # reuses all of that. Entries are refreshed when the remote is updated.
+    _remotes = {}
+
+    @classmethod
+    def _cached_remote(cls, remote):
+        """Return the cached equivalent of ``remote``, caching it if needed."""
+        cached = cls._remotes.get(remote.pk)
+        if cached is None or cached.pulp_last_updated != remote.pulp_last_updated:
+            cls._remotes[remote.pk] = cached = remote
+        return cached
+
     async def list_distributions(self, request):
         """
         The handler for an HTML listing all distributions
@@ -205,13 +240,32 @@ class Handler:
         Returns:
             headers (dict): A dictionary of response headers.
         """
-        content_type, encoding = mimetypes.guess_type(path)
-        headers = {}
+        return dict(Handler._headers_for_extension(''.join(PurePosixPath(path).suffixes)))
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _headers_for_extension(extension):
+        """
+        Compute the response headers for a file extension, caching the result.
+
+        The headers only depend on the extension, so repeated requests for the
+        same type of file skip the mimetypes lookup entirely. The full suffix
+        chain is used so compound extensions like '.tar.gz' resolve to both a
+        Content-Type and a Content-Encoding, matching guess_type on the path.
+
+        Args:
+            extension (str): The file extension(s), including the leading dot.
+
+        Returns:
+            headers (tuple): A tuple of (header, value) pairs.
+        """
+        content_type, encoding = mimetypes.guess_type('name' + extension)
+        headers = []
         if content_type:
-            headers['Content-Type'] = content_type
+            headers.append(('Content-Type', content_type))
         if encoding:
-            headers['Content-Encoding'] = encoding
-        return headers
+            headers.append(('Content-Encoding', encoding))
+        return tuple(headers)
 
     @staticmethod
     def render_html(directory_list):
@@ -224,19 +278,7 @@ class Handler:
         Returns:
             String representing HTML of the directory listing.
         """
-        template = Template("""
-        <!DOCTYPE html>
-        <html>
-            <body>
-                <ul>
-                {% for name in dir_list %}
-                    <li><a href="{{ name|e }}">{{ name|e }}</a></li>
-                {% endfor %}
-                </ul>
-            </body>
-        </html>
-        """)
-        return template.render(dir_list=sorted(directory_list))
+        return _DIRECTORY_LISTING_TEMPLATE.render(dir_list=sorted(directory_list))
 
     async def list_directory(self, repo_version, publication, path):
         """
@@ -259,30 +301,36 @@ class Handler:
         if publication and repo_version:
             raise Exception("Either a repo_version or publication can be specified.")
 
-        def file_or_directory_name(directory_path, relative_path):
-            result = re.match(r'({})([^\/]*)(\/*)'.format(directory_path), relative_path)
-            return '{}{}'.format(result.groups()[1], result.groups()[2])
+        # Compiled once per listing instead of formatted and matched per row.
+        name_regex = re.compile(r'({})([^\/]*)(\/*)'.format(path))
+
+        def file_or_directory_name(relative_path):
+            match = name_regex.match(relative_path)
+            return '{}{}'.format(match.group(2), match.group(3))
 
         directory_list = set()
 
         if publication:
-            pas = publication.published_artifact.filter(relative_path__startswith=path)
-            for pa in pas:
-                directory_list.add(file_or_directory_name(path, pa.relative_path))
+            pas = publication.published_artifact.filter(
+                relative_path__startswith=path).values_list('relative_path', flat=True)
+            for relative_path in pas:
+                directory_list.add(file_or_directory_name(relative_path))
 
             if publication.pass_through:
                 cas = ContentArtifact.objects.filter(
                         content__in=publication.repository_version.content,
-                        relative_path__startswith=path)
-                for ca in cas:
-                    directory_list.add(file_or_directory_name(path, ca.relative_path))
+                        relative_path__startswith=path
+                ).values_list('relative_path', flat=True)
+                for relative_path in cas:
+                    directory_list.add(file_or_directory_name(relative_path))
 
         if repo_version:
             cas = ContentArtifact.objects.filter(
                 content__in=repo_version.content,
-                relative_path__startswith=path)
-            for ca in cas:
-                directory_list.add(file_or_directory_name(path, ca.relative_path))
+                relative_path__startswith=path
+            ).values_list('relative_path', flat=True)
+            for relative_path in cas:
+                directory_list.add(file_or_directory_name(relative_path))
 
         if directory_list:
             return self.render_html(directory_list)
@@ -537,9 +585,9 @@ class Handler:
         Returns:
             The :class:`aiohttp.web.FileResponse` for the file.
         """
-        if settings.DEFAULT_FILE_STORAGE == 'pulpcore.app.models.storage.FileSystem':
-            return FileResponse(os.path.join(settings.MEDIA_ROOT, file.name), headers=headers)
-        elif settings.DEFAULT_FILE_STORAGE == 'storages.backends.s3boto3.S3Boto3Storage':
+        if DEFAULT_FILE_STORAGE == 'pulpcore.app.models.storage.FileSystem':
+            return FileResponse(os.path.join(MEDIA_ROOT, file.name), headers=headers)
+        elif DEFAULT_FILE_STORAGE == 'storages.backends.s3boto3.S3Boto3Storage':
             raise HTTPFound(file.url, headers=headers)
         else:
             raise NotImplementedError()
@@ -561,7 +609,7 @@ class Handler:
                 the client.
 
         """
-        remote = remote_artifact.remote.cast()
+        remote = self._cached_remote(remote_artifact.remote.cast())
 
         async def handle_headers(headers):
             for name, value in headers.items():
@@ -76,11 +76,16 @@ def _queue_reserved_task(func, inner_task_id, resources, inner_args, inner_kwarg
     redis_conn = connection.get_redis_connection()
     task_status = Task.objects.get(pk=inner_task_id)
     task_name = func.__module__ + '.' + func.__name__
+    # Back off exponentially between retries: the first ones come quickly so a
+    # free worker is picked up promptly, later ones are spaced out so a blocked
+    # resource-manager does not hammer the database while reservations are held.
+    delay = 0.1
     while True:
         if task_name == "pulpcore.app.tasks.orphan.orphan_cleanup":
             if ReservedResource.objects.exists():
                 # wait until there are no reservations
-                time.sleep(0.25)
+                time.sleep(delay)
+                delay = min(delay * 1.5, 2.0)
                 continue
             else:
                 rq_worker = util.get_current_worker()
@@ -97,14 +102,16 @@ def _queue_reserved_task(func, inner_task_id, resources, inner_args, inner_kwarg
             worker = _acquire_worker(resources)
         except Worker.DoesNotExist:
             # no worker is ready so we need to wait
-            time.sleep(0.25)
+            time.sleep(delay)
+            delay = min(delay * 1.5, 2.0)
             continue
 
         try:
             worker.lock_resources(task_status, resources)
         except IntegrityError:
             # we have a worker but we can't create the reservations so wait
-            time.sleep(0.25)
+            time.sleep(delay)
+            delay = min(delay * 1.5, 2.0)
         else:
             # we have a worker with the locks
             break